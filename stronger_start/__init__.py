@@ -1,7 +1,13 @@
 """Stronger Start for Working Families Act analysis package."""
 
+from importlib import import_module
+
 from .reform import stronger_start_reform
-from .household import calculate_net_income_changes
+from .household import (
+    calculate_net_income_changes,
+    calculate_net_income_changes_by_children,
+    net_income_change_knots,
+)
 from .statewide import (
     DECILES,
     GAIN_MORE_THAN_5PCT,
@@ -22,28 +28,42 @@ from .statewide import (
     GINI_IMPACT_PCT,
     AVG_BENEFIT_PER_HOUSEHOLD,
 )
-from .charts import (
-    create_net_income_change_chart,
-    create_baseline_reform_comparison_chart,
-    create_winners_by_decile_chart,
-    create_avg_benefit_by_decile_chart,
-)
-from .ten_year_impact import (
-    calculate_ten_year_impact,
-    format_impact_table,
-    YearlyImpact,
-)
-from .dynamic_charts import (
-    calculate_decile_impacts,
-    create_dynamic_winners_by_decile_chart,
-    create_dynamic_avg_benefit_by_decile_chart,
-    create_dynamic_net_income_change_chart,
-    create_dynamic_baseline_reform_chart,
-)
+
+# Chart, projection, and microsimulation helpers pull in Plotly and
+# PolicyEngine-US, so they are imported on first attribute access (PEP 562)
+_LAZY_IMPORTS = {
+    "create_net_income_change_chart": ".charts",
+    "create_baseline_reform_comparison_chart": ".charts",
+    "create_winners_by_decile_chart": ".charts",
+    "create_avg_benefit_by_decile_chart": ".charts",
+    "figure_to_json": "._html",
+    "calculate_ten_year_impact": ".ten_year_impact",
+    "format_impact_table": ".ten_year_impact",
+    "YearlyImpact": ".ten_year_impact",
+    "calculate_decile_impacts": ".dynamic_charts",
+    "create_dynamic_winners_by_decile_chart": ".dynamic_charts",
+    "create_dynamic_avg_benefit_by_decile_chart": ".dynamic_charts",
+    "create_dynamic_net_income_change_chart": ".dynamic_charts",
+    "create_dynamic_baseline_reform_chart": ".dynamic_charts",
+}
+
+
+def __getattr__(name: str):
+    module_name = _LAZY_IMPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    value = getattr(import_module(module_name, __name__), name)
+    # Cache so later lookups bypass __getattr__
+    globals()[name] = value
+    return value
+
 
 __all__ = [
     "stronger_start_reform",
     "calculate_net_income_changes",
+    "calculate_net_income_changes_by_children",
+    "net_income_change_knots",
     "DECILES",
     "GAIN_MORE_THAN_5PCT",
     "GAIN_LESS_THAN_5PCT",
@@ -66,6 +86,7 @@ __all__ = [
     "create_baseline_reform_comparison_chart",
     "create_winners_by_decile_chart",
     "create_avg_benefit_by_decile_chart",
+    "figure_to_json",
     "calculate_ten_year_impact",
     "format_impact_table",
     "YearlyImpact",
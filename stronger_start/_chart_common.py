@@ -0,0 +1,262 @@
+"""Plotly building blocks shared by the static and dynamic charts."""
+
+from functools import cache, wraps
+from typing import NamedTuple
+
+import plotly.graph_objects as go
+from plotly.subplots import make_subplots
+
+# PolicyEngine app-v2 color palette - matching WinnersLosersIncomeDecileSubPage.tsx
+BLACK = "#000000"
+
+# Primary teal colors
+PRIMARY_500 = "#319795"  # colors.primary[500] - main brand color
+PRIMARY_700 = "#285E61"  # colors.primary[700] - dark teal for gains >5%
+PRIMARY_ALPHA_60 = (
+    "rgba(49, 151, 149, 0.6)"  # colors.primary.alpha[60] - teal with 60% opacity
+)
+
+# Gray scale
+GRAY_200 = "#E5E7EB"  # colors.gray[200] - no change
+GRAY_400 = "#9CA3AF"  # colors.gray[400] - loss <5%
+GRAY_600 = "#4B5563"  # colors.gray[600] - loss >5%
+
+# Chart watermark configuration
+WATERMARK_CONFIG = {
+    "source": "https://policyengine.github.io/utah-sb60-calc/assets/teal-square-transparent.png",
+    "xref": "paper",
+    "yref": "paper",
+    "sizex": 0.07,
+    "sizey": 0.07,
+    "xanchor": "right",
+    "yanchor": "bottom",
+}
+
+# Layout properties shared by every chart, merged into each figure's layout
+COMMON_LAYOUT = {
+    "font": {"family": "Roboto Serif", "color": BLACK},
+}
+
+# Shared axis and watermark settings, built once and reused by every figure
+# (figures copy their input, so sharing these dicts is safe)
+INCOME_XAXIS = {
+    "title": {"text": "Employment income"},
+    "tickformat": ",",
+    "tickprefix": "$",
+    "fixedrange": True,
+}
+DOLLAR_YAXIS = {"tickformat": ",", "tickprefix": "$", "fixedrange": True}
+
+WATERMARK_LINE_CHART = dict(WATERMARK_CONFIG, x=1.05, y=-0.22)
+WATERMARK_WINNERS_CHART = dict(
+    WATERMARK_CONFIG, sizex=0.09, sizey=0.09, x=1.05, y=-0.20
+)
+WATERMARK_BAR_CHART = dict(WATERMARK_CONFIG, x=1.05, y=-0.18)
+
+
+class WinnersCategory(NamedTuple):
+    """One outcome band of the winners chart's stacked bars."""
+
+    name: str  # Key into the outcome series
+    legend_name: str
+    legendgroup: str
+    color: str
+    textfont: dict | None  # Overrides Plotly's automatic label color
+
+
+# Outcome bands in stacking order, with shortened legend labels and colors
+# matching app-v2 WinnersLosersIncomeDecileSubPage.tsx
+WINNERS_CATEGORIES = tuple(
+    WinnersCategory(
+        name, legend_name, name.lower().replace(" ", "_"), color, textfont
+    )
+    for name, legend_name, color, textfont in (
+        ("Gain more than 5%", "Gain >5%", PRIMARY_700, None),
+        ("Gain less than 5%", "Gain <5%", PRIMARY_ALPHA_60, {"color": BLACK}),
+        ("No change", "No change", GRAY_200, {"color": BLACK}),
+        ("Lose less than 5%", "Loss <5%", GRAY_400, None),
+        ("Lose more than 5%", "Loss >5%", GRAY_600, None),
+    )
+)
+
+# Axes for the winners chart: a thin "All" row stacked above the deciles.
+# Laid out once by make_subplots so figures can be built without validation.
+WINNERS_SUBPLOT_AXES = {
+    name: axis
+    for name, axis in make_subplots(
+        rows=2,
+        cols=1,
+        shared_xaxes=True,
+        vertical_spacing=0.02,
+        row_heights=[0.1, 0.9],
+    )
+    .layout.to_plotly_json()
+    .items()
+    if name != "template"
+}
+
+
+def build_figure(traces: list[dict], layout: dict) -> go.Figure:
+    """Wrap trace and layout dicts in a Figure without re-validating them.
+
+    Chart specs are assembled in code from known-good values, so Plotly's
+    per-property validation is pure overhead. Dicts must use Plotly's canonical
+    nested form (e.g. ``marker=dict(color=...)``, not ``marker_color=...``).
+    """
+    return go.Figure({"data": traces, "layout": layout}, _validate=False)
+
+
+def memoize_figure(builder):
+    """Build a chart once per process and return a fresh copy on each call.
+
+    For charts that take no arguments and depend only on module constants, the
+    figure dict never changes. Each call still gets its own Figure, so callers
+    can mutate the result without affecting later calls.
+    """
+
+    @cache
+    def figure_dict() -> dict:
+        return builder().to_plotly_json()
+
+    @wraps(builder)
+    def cached_builder() -> go.Figure:
+        return go.Figure(figure_dict(), _validate=False)
+
+    return cached_builder
+
+
+def plain_list(values) -> list:
+    """Convert a NumPy series to a plain list for a trace.
+
+    memoize_figure caches charts via Figure.to_plotly_json, which encodes NumPy
+    arrays as base64 typed arrays. Those come out larger in the page than the
+    short decimals in these series, so traces hold lists instead.
+    """
+    return values.tolist()
+
+
+def winners_layout() -> dict:
+    """Layout for the winners-by-decile chart: an "All" row above the deciles."""
+    return dict(
+        COMMON_LAYOUT,
+        barmode="stack",
+        title=dict(
+            text="Figure 3: Winners of Stronger Start for Working Families Act by income decile",
+            x=0,
+        ),
+        xaxis=dict(
+            WINNERS_SUBPLOT_AXES["xaxis"],
+            title=dict(text=""),
+            ticksuffix="%",
+            range=[0, 100],
+            showgrid=False,
+            showticklabels=False,
+            fixedrange=True,
+        ),
+        xaxis2=dict(
+            WINNERS_SUBPLOT_AXES["xaxis2"],
+            title=dict(text="Population share"),
+            ticksuffix="%",
+            range=[0, 100],
+            fixedrange=True,
+        ),
+        yaxis=dict(
+            WINNERS_SUBPLOT_AXES["yaxis"],
+            title=dict(text=""),
+            tickvals=["All"],
+        ),
+        yaxis2=dict(
+            WINNERS_SUBPLOT_AXES["yaxis2"],
+            title=dict(text="Income decile"),
+            automargin=True,
+        ),
+        legend=dict(
+            title=dict(text=""),
+            orientation="h",
+            yanchor="bottom",
+            y=1.08,
+            xanchor="center",
+            x=0.5,
+            traceorder="normal",
+            font=dict(size=10),
+        ),
+        margin={"l": 60, "r": 60, "b": 100, "t": 120, "pad": 4},
+        height=580,
+        width=800,
+        uniformtext=dict(
+            mode="hide",
+            minsize=8,
+        ),
+        images=[WATERMARK_WINNERS_CHART],
+    )
+
+
+def avg_benefit_layout() -> dict:
+    """Layout for the average-benefit-by-decile bar chart."""
+    return dict(
+        COMMON_LAYOUT,
+        title=dict(
+            text="Figure 3: Average benefit of Stronger Start for Working Families Act by income decile"
+        ),
+        xaxis=dict(
+            title=dict(text="Income decile"),
+            tickvals=list(range(1, 11)),
+            fixedrange=True,
+        ),
+        yaxis=dict(
+            DOLLAR_YAXIS, title=dict(text="Absolute change in household income")
+        ),
+        showlegend=False,
+        margin={"l": 60, "r": 60, "b": 80, "t": 80, "pad": 4},
+        images=[WATERMARK_BAR_CHART],
+    )
+
+
+def percent_labels(values) -> tuple[str, ...]:
+    """Format stacked-bar segment labels, hiding empty segments."""
+    return tuple(f"{x:.0f}%" if x > 0 else "" for x in values)
+
+
+def stacked_bar_traces(
+    labels,
+    series: dict[str, list[float]],
+    row: int,
+    show_legend: bool,
+    text: dict[str, tuple[str, ...]] | None = None,
+) -> list[dict]:
+    """Build stacked bar trace dicts for one row of the winners chart.
+
+    Args:
+        labels: Y-axis category labels (income deciles, or ["All"])
+        series: Outcome percentages keyed by category name, aligned with labels
+        text: Precomputed bar labels keyed like series; formatted from the
+            values when omitted
+    """
+    # Subplot rows map to axis pairs x/y, x2/y2, ...
+    axis_suffix = "" if row == 1 else str(row)
+
+    traces = []
+    for category in WINNERS_CATEGORIES:
+        values = series[category.name]
+
+        trace = dict(
+            type="bar",
+            y=labels,
+            x=values,
+            name=category.legend_name,
+            orientation="h",
+            marker=dict(color=category.color),
+            text=text[category.name] if text else percent_labels(values),
+            textposition="inside",
+            textangle=0,
+            legendgroup=category.legendgroup,
+            showlegend=show_legend,
+            hovertemplate="%{x:.1f}%<extra></extra>",
+            xaxis=f"x{axis_suffix}",
+            yaxis=f"y{axis_suffix}",
+        )
+        if category.textfont:
+            trace["textfont"] = category.textfont
+        traces.append(trace)
+
+    return traces
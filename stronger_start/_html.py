@@ -0,0 +1,237 @@
+"""Standalone HTML page rendering for generated charts."""
+
+import hashlib
+import json
+from pathlib import Path
+
+from plotly.utils import PlotlyJSONEncoder
+
+try:
+    import orjson
+except ImportError:  # Fall back to Plotly's own JSON encoder
+    orjson = None
+
+# Characters escaped in inline figure JSON (same set as plotly.io.to_json)
+_JSON_SCRIPT_ESCAPES = (
+    (b"<", b"\\u003c"),
+    (b">", b"\\u003e"),
+    (b"/", b"\\u002f"),
+    ("\u2028".encode("utf-8"), b"\\u2028"),
+    ("\u2029".encode("utf-8"), b"\\u2029"),
+)
+
+# Base URL for GitHub Pages
+BASE_URL = "https://policyengine.github.io/stronger-start-calc"
+
+# HTML template for standalone chart files
+HTML_TEMPLATE = """<!DOCTYPE html>
+<html lang="en">
+<head>
+    <meta charset="UTF-8">
+    <meta name="viewport" content="width=device-width, initial-scale=1.0">
+    <title>{title} | PolicyEngine</title>
+    <meta name="description" content="{description}">
+    <link rel="canonical" href="{canonical_url}">
+    <meta name="theme-color" content="#319795">
+
+    <!-- Open Graph -->
+    <meta property="og:type" content="article">
+    <meta property="og:title" content="{title}">
+    <meta property="og:description" content="{description}">
+    <meta property="og:url" content="{canonical_url}">
+    <meta property="og:site_name" content="PolicyEngine">
+    <meta property="og:image" content="https://policyengine.org/images/logos/policyengine/profile/PNG/policyengine-logo-teal.png">
+
+    <!-- Twitter Card -->
+    <meta name="twitter:card" content="summary_large_image">
+    <meta name="twitter:title" content="{title}">
+    <meta name="twitter:description" content="{description}">
+    <meta name="twitter:image" content="https://policyengine.org/images/logos/policyengine/profile/PNG/policyengine-logo-teal.png">
+
+    <!-- Structured Data -->
+    <script type="application/ld+json">
+    {{
+        "@context": "https://schema.org",
+        "@type": "Dataset",
+        "name": "{title}",
+        "description": "{description}",
+        "url": "{canonical_url}",
+        "creator": {{
+            "@type": "Organization",
+            "name": "PolicyEngine",
+            "url": "https://policyengine.org"
+        }},
+        "license": "https://opensource.org/licenses/MIT",
+        "keywords": ["Child Tax Credit", "Stronger Start", "Working Families Act", "tax policy", "policy analysis"]
+    }}
+    </script>
+
+    <link rel="preconnect" href="https://fonts.googleapis.com">
+    <link rel="preconnect" href="https://fonts.gstatic.com" crossorigin>
+    <link href="https://fonts.googleapis.com/css2?family=Roboto+Serif:wght@400;500;600&display=swap" rel="stylesheet">
+    <script src="https://cdn.plot.ly/plotly-2.27.0.min.js"></script>
+    <script async src="https://www.googletagmanager.com/gtag/js?id=G-2YHG89FY0N"></script>
+    <script>
+        window.dataLayer = window.dataLayer || [];
+        function gtag(){{dataLayer.push(arguments);}}
+        gtag('js', new Date());
+        gtag('config', 'G-2YHG89FY0N', {{ tool_name: 'stronger-start-calc' }});
+    </script>
+    <script>
+    (function() {{
+      var TOOL_NAME = 'stronger-start-calc';
+      if (typeof window === 'undefined' || !window.gtag) return;
+
+      var scrollFired = {{}};
+      window.addEventListener('scroll', function() {{
+        var docHeight = document.documentElement.scrollHeight - window.innerHeight;
+        if (docHeight <= 0) return;
+        var pct = Math.floor((window.scrollY / docHeight) * 100);
+        [25, 50, 75, 100].forEach(function(m) {{
+          if (pct >= m && !scrollFired[m]) {{
+            scrollFired[m] = true;
+            window.gtag('event', 'scroll_depth', {{ percent: m, tool_name: TOOL_NAME }});
+          }}
+        }});
+      }}, {{ passive: true }});
+
+      [30, 60, 120, 300].forEach(function(sec) {{
+        setTimeout(function() {{
+          if (document.visibilityState !== 'hidden') {{
+            window.gtag('event', 'time_on_tool', {{ seconds: sec, tool_name: TOOL_NAME }});
+          }}
+        }}, sec * 1000);
+      }});
+
+      document.addEventListener('click', function(e) {{
+        var link = e.target && e.target.closest ? e.target.closest('a') : null;
+        if (!link || !link.href) return;
+        try {{
+          var url = new URL(link.href, window.location.origin);
+          if (url.hostname && url.hostname !== window.location.hostname) {{
+            window.gtag('event', 'outbound_click', {{
+              url: link.href,
+              target_hostname: url.hostname,
+              tool_name: TOOL_NAME
+            }});
+          }}
+        }} catch (err) {{}}
+      }});
+    }})();
+    </script>
+    <style>
+        body {{
+            margin: 0;
+            padding: 0;
+            font-family: 'Roboto Serif', serif;
+        }}
+        #chart {{
+            width: 100%;
+            height: 100vh;
+        }}
+        .sr-only {{
+            position: absolute;
+            width: 1px;
+            height: 1px;
+            padding: 0;
+            margin: -1px;
+            overflow: hidden;
+            clip: rect(0, 0, 0, 0);
+            white-space: nowrap;
+            border: 0;
+        }}
+    </style>
+</head>
+<body>
+    <main>
+        <article>
+            <h1 class="sr-only">{title}</h1>
+            <div id="chart" role="img" aria-label="{title}"></div>
+            <noscript>
+                <p>This interactive chart requires JavaScript to display. It shows: {description}</p>
+            </noscript>
+        </article>
+    </main>
+    <script>
+        var figure = {figure_json};
+        Plotly.newPlot('chart', figure.data, figure.layout, {{responsive: true}});
+    </script>
+</body>
+</html>
+"""
+
+# Split once at import so each chart only formats the small page header; the
+# figure JSON is spliced in as bytes without being scanned by str.format
+_TEMPLATE_HEAD, _TEMPLATE_TAIL = HTML_TEMPLATE.split("{figure_json}")
+_TEMPLATE_TAIL_BYTES = _TEMPLATE_TAIL.format().encode("utf-8")
+
+
+def figure_to_json(fig) -> bytes:
+    """Serialize a Plotly figure to JSON that is safe to inline in a <script>.
+
+    Serializes ``fig.to_plotly_json()``, which deep-copies the figure just as
+    ``fig.to_json()`` does. The saving is in the encode: when available, orjson
+    writes the dict directly instead of going through plotly.io's JSON engine.
+    """
+    fig_dict = fig.to_plotly_json()
+
+    figure_json = None
+    if orjson is not None:
+        try:
+            figure_json = orjson.dumps(fig_dict, option=orjson.OPT_SERIALIZE_NUMPY)
+        except TypeError:
+            # Values orjson can't encode natively (e.g. numpy object arrays)
+            pass
+
+    if figure_json is None:
+        # Plotly's encoder handles anything a figure can hold; this is the
+        # same encode fig.to_json() does when orjson isn't in use
+        figure_json = json.dumps(
+            fig_dict, cls=PlotlyJSONEncoder, separators=(",", ":")
+        ).encode("utf-8")
+
+    # Match Plotly's escaping so the JSON can't close the <script> tag
+    for unsafe, safe in _JSON_SCRIPT_ESCAPES:
+        figure_json = figure_json.replace(unsafe, safe)
+    return figure_json
+
+
+def build_chart_json(builder, *args) -> bytes:
+    """Build a chart and serialize it; runs in a worker process."""
+    return figure_to_json(builder(*args))
+
+
+def write_chart_html(
+    figure_json: bytes, title: str, filename: str, description: str, charts_dir: Path
+) -> None:
+    """Write standalone HTML file for an already-serialized Plotly chart.
+
+    A BLAKE2 digest of the page is kept next to it, and the write is skipped
+    when the existing file already has the same content.
+    """
+    canonical_url = f"{BASE_URL}/{filename}"
+    head = _TEMPLATE_HEAD.format(
+        title=title,
+        description=description,
+        canonical_url=canonical_url,
+    )
+
+    html = b"".join((head.encode("utf-8"), figure_json, _TEMPLATE_TAIL_BYTES))
+    digest = hashlib.blake2b(html, digest_size=8).hexdigest()
+
+    filepath = charts_dir / filename
+    # Hidden sibling, so `cp output/charts/*` doesn't publish it
+    hash_path = charts_dir / f".{filename}.hash"
+    if (
+        filepath.exists()
+        and hash_path.exists()
+        and hash_path.read_text().strip() == digest
+    ):
+        print(f"Unchanged: {filepath}")
+        return
+
+    with open(filepath, "wb") as f:
+        f.write(html)
+    hash_path.write_text(digest)
+
+    print(f"Generated: {filepath}")
@@ -0,0 +1,77 @@
+"""Shared PolicyEngine-US microsimulations.
+
+Constructing a Microsimulation loads the dataset and, for the reform, rebuilds
+and uprates the tax-benefit system, which takes several seconds. Simulations
+are not tied to a year, so one baseline and one reform instance serve every
+calculation in the process. Raw variable arrays are cached the same way, so
+repeated lookups skip re-wrapping them in weighted MicroSeries.
+
+PolicyEngine-US takes seconds to import, so it is only imported once a
+simulation is actually needed; callers whose results are cached on disk never
+pay for it.
+"""
+
+import hashlib
+import json
+from functools import cache
+from importlib.metadata import version
+from typing import TYPE_CHECKING
+
+import numpy as np
+
+from .reform import REFORM_PARAMETERS, stronger_start_reform
+
+if TYPE_CHECKING:
+    from policyengine_us import Microsimulation
+
+# Part of every results cache key. Bump it whenever calculate_decile_impacts or
+# calculate_yearly_cost changes what it computes, so stale results are ignored.
+RESULTS_VERSION = 1
+
+
+def results_cache_key(year: int) -> str:
+    """Key on-disk simulation results on everything that can change them."""
+    inputs = {
+        "reform": REFORM_PARAMETERS,
+        "year": year,
+        "policyengine_us": version("policyengine-us"),
+        "results_version": RESULTS_VERSION,
+    }
+    payload = json.dumps(inputs, sort_keys=True).encode("utf-8")
+    return hashlib.blake2b(payload, digest_size=8).hexdigest()
+
+
+@cache
+def get_baseline_simulation() -> "Microsimulation":
+    """Return the current-law microsimulation, constructing it on first use."""
+    from policyengine_us import Microsimulation
+
+    return Microsimulation()
+
+
+@cache
+def get_reform_simulation() -> "Microsimulation":
+    """Return the Stronger Start microsimulation, constructing it on first use."""
+    from policyengine_us import Microsimulation
+
+    return Microsimulation(reform=stronger_start_reform)
+
+
+def _read_only_values(simulation: "Microsimulation", variable: str, period: int):
+    # Shared between callers, so nobody may modify it in place. Lock a view
+    # rather than the array itself, which PolicyEngine may still write to.
+    values = simulation.calculate(variable, period=period).values.view()
+    values.flags.writeable = False
+    return values
+
+
+@cache
+def baseline_values(variable: str, period: int) -> np.ndarray:
+    """Return a variable's unweighted values under current law (read-only)."""
+    return _read_only_values(get_baseline_simulation(), variable, period)
+
+
+@cache
+def reform_values(variable: str, period: int) -> np.ndarray:
+    """Return a variable's unweighted values under the reform (read-only)."""
+    return _read_only_values(get_reform_simulation(), variable, period)
@@ -3,13 +3,69 @@
 Uses PolicyEngine-US to calculate distributional impacts by income decile.
 """
 
+import logging
+import pickle
+from pathlib import Path
+
 import numpy as np
-from policyengine_us import Microsimulation
 
-from ..reform import stronger_start_reform
+from .._simulations import baseline_values, reform_values, results_cache_key
+
+logger = logging.getLogger(__name__)
+
+# Outcome categories in chart order; a household's outcome code is its index
+OUTCOME_KEYS = (
+    "gain_more_than_5pct",
+    "gain_less_than_5pct",
+    "no_change",
+    "loss_less_than_5pct",
+    "loss_more_than_5pct",
+)
+# Code for households in none of the above: income changed from a
+# non-positive baseline, so there is no percentage change to bucket
+_UNCATEGORIZED = len(OUTCOME_KEYS)
+
+# Percentage-change bucket edges for np.searchsorted(side="right"), which
+# counts the edges <= each value. The buckets are (-inf, -5), [-5, 0), {0},
+# (0, 5] and (5, inf); nudging the last two edges up one ulp makes 0 and 5
+# fall in the lower bucket.
+_PCT_CHANGE_EDGES = np.array(
+    [-5.0, 0.0, np.nextafter(0.0, 1.0), np.nextafter(5.0, np.inf)]
+)
+# Outcome code for each bucket, in ascending bucket order
+_BUCKET_OUTCOME_CODES = np.array([4, 3, 2, 1, 0], dtype=np.uint8)
+
+
+def _percent_change(income_change, baseline_income) -> np.ndarray:
+    """Percentage change in income, 0 where the baseline is non-positive."""
+    # Divide only where the baseline is positive
+    pct_change = np.zeros_like(income_change)
+    np.divide(
+        income_change,
+        baseline_income,
+        out=pct_change,
+        where=baseline_income > 0,
+    )
+    pct_change *= 100
+    return pct_change
+
+
+def _outcome_codes(pct_change, income_change) -> np.ndarray:
+    """Outcome code per household: an index into OUTCOME_KEYS, or _UNCATEGORIZED.
+
+    One uint8 code per household from a single bucketing pass, instead of one
+    comparison per category.
+    """
+    outcome = _BUCKET_OUTCOME_CODES[
+        np.searchsorted(_PCT_CHANGE_EDGES, pct_change, side="right")
+    ]
+    # A 0% change only means "no change" if income didn't move; otherwise the
+    # baseline was non-positive and the household fits no category
+    outcome[(outcome == 2) & (income_change != 0)] = _UNCATEGORIZED
+    return outcome
 
 
-def calculate_decile_impacts(year: int = 2026) -> dict:
+def calculate_decile_impacts(year: int = 2026, cache_dir: Path | None = None) -> dict:
     """
     Calculate distributional impacts by income decile using microsimulation.
 
@@ -18,6 +74,9 @@ def calculate_decile_impacts(year: int = 2026) -> dict:
 
     Args:
         year: The tax year to simulate
+        cache_dir: If given, results are pickled here keyed on the reform
+            parameters, year and policyengine-us version, and reused on
+            later runs instead of re-running the microsimulation
 
     Returns:
         Dictionary with:
@@ -25,181 +84,154 @@ def calculate_decile_impacts(year: int = 2026) -> dict:
         - all_outcomes: dict with overall population percentages
         - avg_impact_by_decile: list of average dollar impacts per decile (household-weighted)
     """
-    print(f"Running microsimulation for {year}...")
+    if cache_dir is not None:
+        cache_path = cache_dir / f"decile_impacts_{results_cache_key(year)}.pkl"
+        if cache_path.exists():
+            print(f"Using cached microsimulation results: {cache_path}")
+            with open(cache_path, "rb") as f:
+                return pickle.load(f)
 
-    # Run baseline and reform simulations
-    baseline = Microsimulation()
-    reform = Microsimulation(reform=stronger_start_reform)
+    print(f"Running microsimulation for {year}...")
 
     # =========================================================================
     # HOUSEHOLD-LEVEL DATA (for average impact by decile)
     # =========================================================================
-    household_income_decile_hh = baseline.calculate(
-        "household_income_decile", period=year
-    ).values
-    household_weights_hh = baseline.calculate("household_weight", period=year).values
-    baseline_income_hh = baseline.calculate("household_net_income", period=year).values
-    reform_income_hh = reform.calculate("household_net_income", period=year).values
+    # Baseline and reform simulations are shared with the budget calculations
+    household_income_decile_hh = baseline_values("household_income_decile", year)
+    household_weights_hh = baseline_values("household_weight", year)
+    baseline_income_hh = baseline_values("household_net_income", year)
+    reform_income_hh = reform_values("household_net_income", year)
 
     # Calculate change at household level
     income_change_hh = reform_income_hh - baseline_income_hh
 
+    # Bin index per household for np.bincount: deciles 1-10 keep their slot,
+    # anything outside that range lands in slot 0 or 11 and is dropped
+    decile_bins = np.clip(household_income_decile_hh, 0, 11).astype(np.intp)
+
+    def sum_by_decile(weights):
+        """Weighted sum for deciles 1-10 in a single pass over households."""
+        return np.bincount(decile_bins, weights=weights, minlength=12)[1:11]
+
+    decile_weight_hh = sum_by_decile(household_weights_hh)
+
+    def per_decile_weight(totals):
+        """Divide per-decile totals (one row per decile) by each decile's
+        weight, leaving 0 for empty deciles."""
+        weight = decile_weight_hh.reshape(-1, *[1] * (totals.ndim - 1))
+        result = np.zeros(totals.shape)
+        np.divide(totals, weight, out=result, where=weight > 0)
+        return result
+
     # Calculate average impact by decile (household-weighted)
-    avg_impact_by_decile = []
-    for decile in range(1, 11):
-        in_decile_hh = household_income_decile_hh == decile
-        decile_weight_hh = household_weights_hh[in_decile_hh].sum()
-        if decile_weight_hh > 0:
-            avg_impact = (
-                income_change_hh[in_decile_hh] * household_weights_hh[in_decile_hh]
-            ).sum() / decile_weight_hh
-            avg_impact_by_decile.append(round(avg_impact, 0))
-        else:
-            avg_impact_by_decile.append(0)
+    decile_change_hh = sum_by_decile(income_change_hh * household_weights_hh)
+    avg_impact_by_decile = np.round(per_decile_weight(decile_change_hh), 0).tolist()
 
     # =========================================================================
     # OUTCOME PERCENTAGES (household-weighted, matching PolicyEngine report)
     # =========================================================================
-    # Calculate percentage change at household level
-    pct_change_hh = np.where(
-        baseline_income_hh > 0,
-        (income_change_hh / baseline_income_hh) * 100,
-        0,
-    )
+    # Calculate percentage change at household level (0 for non-positive
+    # baselines)
+    pct_change_hh = _percent_change(income_change_hh, baseline_income_hh)
 
     # Categorize households by outcome
-    gain_more_5_hh = pct_change_hh > 5
-    gain_less_5_hh = (pct_change_hh > 0) & (pct_change_hh <= 5)
-    no_change_hh = income_change_hh == 0
-    loss_less_5_hh = (pct_change_hh < 0) & (pct_change_hh >= -5)
-    loss_more_5_hh = pct_change_hh < -5
+    outcome_hh = _outcome_codes(pct_change_hh, income_change_hh)
 
     # Use household weights for outcome percentages (matching PolicyEngine report methodology)
     # The original statewide.py data appears to use household-weighted percentages
     outcome_weights = household_weights_hh
 
-    # Calculate outcomes by decile (household-weighted)
+    # Weight of every (decile slot, outcome) pair from a single bincount over
+    # a combined index; rows follow decile_bins, columns the outcome codes
+    num_codes = _UNCATEGORIZED + 1
+    outcome_weight_matrix = np.bincount(
+        decile_bins * num_codes + outcome_hh,
+        weights=outcome_weights,
+        minlength=12 * num_codes,
+    ).reshape(12, num_codes)
+
+    # Calculate outcomes by decile (household-weighted), rounding the whole
+    # (decile, outcome) matrix at once
+    decile_outcome_pct = np.round(
+        per_decile_weight(outcome_weight_matrix[1:11, :_UNCATEGORIZED]) * 100, 1
+    )
     decile_outcomes = {
-        "gain_more_than_5pct": [],
-        "gain_less_than_5pct": [],
-        "no_change": [],
-        "loss_less_than_5pct": [],
-        "loss_more_than_5pct": [],
+        key: decile_outcome_pct[:, code].tolist()
+        for code, key in enumerate(OUTCOME_KEYS)
     }
 
-    for decile in range(1, 11):
-        in_decile = household_income_decile_hh == decile
-        decile_weight = outcome_weights[in_decile].sum()
-
-        if decile_weight > 0:
-            decile_outcomes["gain_more_than_5pct"].append(
-                round(
-                    (outcome_weights[in_decile & gain_more_5_hh].sum() / decile_weight)
-                    * 100,
-                    1,
-                )
+    # Calculate overall population outcomes over all households
+    total_weight = outcome_weights.sum()
+    overall_outcome_pct = np.round(
+        (outcome_weight_matrix[:, :_UNCATEGORIZED].sum(axis=0) / total_weight) * 100,
+        1,
+    )
+    all_outcomes = dict(zip(OUTCOME_KEYS, overall_outcome_pct.tolist()))
+
+    # Diagnostics, computed only when debug logging is on: the decile 1
+    # breakdown below re-scans the household arrays several times
+    if logger.isEnabledFor(logging.DEBUG):
+        logger.debug(f"  Max pct_change: {pct_change_hh.max():.2f}%")
+        logger.debug(f"  Households with >5% gain: {(outcome_hh == 0).sum()}")
+        logger.debug(f"  Overall gain >5%: {all_outcomes['gain_more_than_5pct']}%")
+        logger.debug(
+            f"  Decile 1 gain >5%: {decile_outcomes['gain_more_than_5pct'][0]}%"
+        )
+
+        # More detailed debug for decile 1
+        in_decile_1 = household_income_decile_hh == 1
+        d1_with_gain = in_decile_1 & (income_change_hh > 0)
+        d1_gain_more_5 = in_decile_1 & (outcome_hh == 0)
+        logger.debug(f"  Decile 1 households with any gain: {d1_with_gain.sum()}")
+        if d1_with_gain.sum() > 0:
+            d1_pct_changes = pct_change_hh[d1_with_gain]
+            logger.debug(
+                f"  Decile 1 pct_change range: {d1_pct_changes.min():.2f}% to {d1_pct_changes.max():.2f}%"
             )
-            decile_outcomes["gain_less_than_5pct"].append(
-                round(
-                    (outcome_weights[in_decile & gain_less_5_hh].sum() / decile_weight)
-                    * 100,
-                    1,
-                )
+            logger.debug(f"  Decile 1 pct_change >5%: {(d1_pct_changes > 5).sum()}")
+            logger.debug(f"  Decile 1 pct_change >1%: {(d1_pct_changes > 1).sum()}")
+            # Check baseline income for those with gains
+            d1_baseline = baseline_income_hh[d1_with_gain]
+            d1_change = income_change_hh[d1_with_gain]
+            logger.debug(
+                f"  Decile 1 baseline income range: ${d1_baseline.min():.0f} to ${d1_baseline.max():.0f}"
             )
-            decile_outcomes["no_change"].append(
-                round(
-                    (outcome_weights[in_decile & no_change_hh].sum() / decile_weight)
-                    * 100,
-                    1,
-                )
+            logger.debug(
+                f"  Decile 1 income change range: ${d1_change.min():.0f} to ${d1_change.max():.0f}"
             )
-            decile_outcomes["loss_less_than_5pct"].append(
-                round(
-                    (outcome_weights[in_decile & loss_less_5_hh].sum() / decile_weight)
-                    * 100,
-                    1,
-                )
+
+            # Weight analysis
+            d1_total_weight = outcome_weights[in_decile_1].sum()
+            d1_gain5_weight = outcome_weights[d1_gain_more_5].sum()
+            d1_gain_weight = outcome_weights[d1_with_gain].sum()
+            logger.debug(f"  Decile 1 total weight: {d1_total_weight:,.0f}")
+            logger.debug(
+                f"  Decile 1 >5% gain weight: {d1_gain5_weight:,.0f} ({d1_gain5_weight / d1_total_weight * 100:.3f}%)"
             )
-            decile_outcomes["loss_more_than_5pct"].append(
-                round(
-                    (outcome_weights[in_decile & loss_more_5_hh].sum() / decile_weight)
-                    * 100,
-                    1,
-                )
+            logger.debug(
+                f"  Decile 1 any gain weight: {d1_gain_weight:,.0f} ({d1_gain_weight / d1_total_weight * 100:.2f}%)"
             )
-        else:
-            for key in decile_outcomes:
-                decile_outcomes[key].append(0)
-
-    # Calculate overall population outcomes (person-weighted)
-    total_weight = outcome_weights.sum()
-    all_outcomes = {
-        "gain_more_than_5pct": round(
-            (outcome_weights[gain_more_5_hh].sum() / total_weight) * 100, 1
-        ),
-        "gain_less_than_5pct": round(
-            (outcome_weights[gain_less_5_hh].sum() / total_weight) * 100, 1
-        ),
-        "no_change": round(
-            (outcome_weights[no_change_hh].sum() / total_weight) * 100, 1
-        ),
-        "loss_less_than_5pct": round(
-            (outcome_weights[loss_less_5_hh].sum() / total_weight) * 100, 1
-        ),
-        "loss_more_than_5pct": round(
-            (outcome_weights[loss_more_5_hh].sum() / total_weight) * 100, 1
-        ),
-    }
-
-    # Debug info
-    print(f"  Max pct_change: {pct_change_hh.max():.2f}%")
-    print(f"  Households with >5% gain: {gain_more_5_hh.sum()}")
-    print(f"  Overall gain >5%: {all_outcomes['gain_more_than_5pct']}%")
-    print(f"  Decile 1 gain >5%: {decile_outcomes['gain_more_than_5pct'][0]}%")
-
-    # More detailed debug for decile 1
-    in_decile_1 = household_income_decile_hh == 1
-    d1_with_gain = in_decile_1 & (income_change_hh > 0)
-    d1_gain_more_5 = in_decile_1 & gain_more_5_hh
-    print(f"  Decile 1 households with any gain: {d1_with_gain.sum()}")
-    if d1_with_gain.sum() > 0:
-        d1_pct_changes = pct_change_hh[d1_with_gain]
-        print(
-            f"  Decile 1 pct_change range: {d1_pct_changes.min():.2f}% to {d1_pct_changes.max():.2f}%"
-        )
-        print(f"  Decile 1 pct_change >5%: {(d1_pct_changes > 5).sum()}")
-        print(f"  Decile 1 pct_change >1%: {(d1_pct_changes > 1).sum()}")
-        # Check baseline income for those with gains
-        d1_baseline = baseline_income_hh[d1_with_gain]
-        d1_change = income_change_hh[d1_with_gain]
-        print(
-            f"  Decile 1 baseline income range: ${d1_baseline.min():.0f} to ${d1_baseline.max():.0f}"
-        )
-        print(
-            f"  Decile 1 income change range: ${d1_change.min():.0f} to ${d1_change.max():.0f}"
-        )
 
-        # Weight analysis
-        d1_total_weight = outcome_weights[in_decile_1].sum()
-        d1_gain5_weight = outcome_weights[d1_gain_more_5].sum()
-        d1_gain_weight = outcome_weights[d1_with_gain].sum()
-        print(f"  Decile 1 total weight: {d1_total_weight:,.0f}")
-        print(
-            f"  Decile 1 >5% gain weight: {d1_gain5_weight:,.0f} ({d1_gain5_weight / d1_total_weight * 100:.3f}%)"
-        )
-        print(
-            f"  Decile 1 any gain weight: {d1_gain_weight:,.0f} ({d1_gain_weight / d1_total_weight * 100:.2f}%)"
-        )
-
-    return {
+    results = {
         "decile_outcomes": decile_outcomes,
         "all_outcomes": all_outcomes,
         "avg_impact_by_decile": avg_impact_by_decile,
     }
 
+    if cache_dir is not None:
+        cache_dir.mkdir(parents=True, exist_ok=True)
+        with open(cache_path, "wb") as f:
+            pickle.dump(results, f)
+
+    return results
+
 
 def main():
     """Run the microsimulation and print results for verification."""
+    # Show the diagnostics logged by calculate_decile_impacts
+    logging.basicConfig(format="%(message)s")
+    logger.setLevel(logging.DEBUG)
+
     print("=" * 60)
     print("Stronger Start Dynamic Charts - Microsimulation Data")
     print("=" * 60)
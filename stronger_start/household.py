@@ -1,13 +1,25 @@
 """Household impact calculations for Stronger Start for Working Families Act."""
 
+from functools import lru_cache
 
+import numpy as np
+
+
+def _income_grid(min_income: int, max_income: int, step: int) -> np.ndarray:
+    """Employment incomes from min_income to max_income inclusive (read-only)."""
+    income = np.arange(min_income, max_income + 1, step)
+    income.flags.writeable = False
+    return income
+
+
+@lru_cache(maxsize=None)
 def calculate_net_income_changes(
     filing_status: str = "single",
     num_children: int = 2,
     min_income: int = 0,
     max_income: int = 50000,
     step: int = 100,
-) -> tuple[list[int], list[float]]:
+) -> tuple[np.ndarray, np.ndarray]:
     """
     Calculate change in net income for different household types.
 
@@ -28,10 +40,41 @@ def calculate_net_income_changes(
         step: Income increment step size
 
     Returns:
-        Tuple of (employment_income_values, net_income_changes)
+        Tuple of (employment_income_values, net_income_changes) arrays.
+        Results are cached per argument set, so the arrays are read-only.
     """
-    employment_income_values = list(range(min_income, max_income + 1, step))
-    net_income_changes = []
+    employment_income_values, net_income_changes = (
+        calculate_net_income_changes_by_children(
+            (num_children,), min_income, max_income, step
+        )
+    )
+    return employment_income_values, net_income_changes[0]
+
+
+@lru_cache(maxsize=None)
+def net_income_change_knots(
+    num_children: int = 2,
+) -> tuple[tuple[float, ...], tuple[float, ...]]:
+    """
+    Breakpoints of the net income change curve for one number of children.
+
+    The change is piecewise linear in employment income, so these knots
+    describe it exactly: linear interpolation between them (np.interp) gives
+    the change at any income, and the change is 0 beyond the last knot.
+
+    Args:
+        num_children: Number of children (1-3)
+
+    Returns:
+        Tuple of (employment_incomes, net_income_changes) at the knots, with
+        incomes in increasing order.
+
+    Raises:
+        ValueError: If num_children is less than 1, where the knots would not
+            be increasing and np.interp would silently return wrong values
+    """
+    if num_children < 1:
+        raise ValueError(f"num_children must be at least 1, got {num_children}")
 
     # Calculate phase-out range based on number of children
     # Max refundable CTC is $1,700 per child
@@ -45,36 +88,69 @@ def calculate_net_income_changes(
     reform_reaches_max = (max_refundable_per_child * num_children) / phase_in_rate
     baseline_reaches_max = reform_reaches_max + baseline_threshold
 
-    for income in employment_income_values:
-        if income == 0:
-            # No earnings = no refundable CTC under either baseline or reform
-            change = 0
-        elif income <= baseline_threshold:
-            # Reform gives 15% of income from first dollar
-            # Baseline gives 0 for income <= $2,500
-            # Phases in from $0 to $2,500, reaching $375
-            change = income * phase_in_rate
-        elif income <= reform_reaches_max:
-            # Maximum benefit of $375 between $2,500 and when reform reaches max
-            change = max_benefit
-        elif income <= baseline_reaches_max:
-            # Phases out as baseline catches up to reform
-            # change = $375 - (income - reform_reaches_max) * 0.15
-            change = max_benefit - (income - reform_reaches_max) * phase_in_rate
-        else:
-            # Above baseline_reaches_max, no benefit (both give full refundable credit)
-            change = 0
-
-        net_income_changes.append(change)
+    # No earnings = no refundable CTC under either baseline or reform.
+    # Reform gives 15% of income from first dollar while baseline gives 0 up
+    # to $2,500, so the change phases in to $375. It stays at the maximum
+    # until the reform reaches its max, then phases out as baseline catches
+    # up. Above baseline_reaches_max both give the full refundable credit.
+    return (
+        (
+            0.0,
+            float(baseline_threshold),
+            float(reform_reaches_max),
+            float(baseline_reaches_max),
+        ),
+        (0.0, float(max_benefit), float(max_benefit), 0.0),
+    )
+
+
+@lru_cache(maxsize=None)
+def calculate_net_income_changes_by_children(
+    num_children: tuple[int, ...] = (1, 2, 3),
+    min_income: int = 0,
+    max_income: int = 50000,
+    step: int = 100,
+) -> tuple[np.ndarray, np.ndarray]:
+    """
+    Calculate change in net income for several numbers of children at once.
+
+    Same calculation as calculate_net_income_changes, sampled for every
+    child count by interpolating the closed-form net_income_change_knots.
+
+    Args:
+        num_children: Numbers of children, one result row each
+        min_income: Minimum employment income to calculate
+        max_income: Maximum employment income to calculate
+        step: Income increment step size
+
+    Returns:
+        Tuple of (employment_income_values, net_income_changes) read-only
+        arrays, where net_income_changes is 2D with rows in num_children order.
+    """
+    employment_income_values = _income_grid(min_income, max_income, step)
+
+    # One row per child count; the curve is linear between its knots
+    net_income_changes = np.array(
+        [
+            np.interp(employment_income_values, *net_income_change_knots(n))
+            for n in num_children
+        ]
+    ).reshape(len(num_children), len(employment_income_values))
+
+    # Round to cents; float noise like 365.0000000000001 only bloats chart JSON
+    net_income_changes = np.round(net_income_changes, 2)
+    # Results are cached and shared, so callers must not modify them
+    net_income_changes.flags.writeable = False
 
     return employment_income_values, net_income_changes
 
 
+@lru_cache(maxsize=None)
 def calculate_baseline_reform_comparison(
     min_income: int = 0,
     max_income: int = 20000,
     step: int = 100,
-) -> tuple[list[int], list[float], list[float]]:
+) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
     """
     Calculate refundable CTC for baseline and reform scenarios.
 
@@ -92,29 +168,31 @@ def calculate_baseline_reform_comparison(
 
     Returns:
         Tuple of (employment_income_values, baseline_credits, reform_credits)
+        arrays. Results are cached per argument set, so the arrays are read-only.
     """
-    employment_income_values = list(range(min_income, max_income + 1, step))
-    baseline_credits = []
-    reform_credits = []
+    employment_income_values = _income_grid(min_income, max_income, step)
+    income = employment_income_values.astype(np.float64)
 
     PHASE_IN_RATE = 0.15
     MAX_REFUNDABLE = 1700
     BASELINE_THRESHOLD = 2500
     REFORM_THRESHOLD = 0
 
-    for income in employment_income_values:
-        # Baseline: phases in from $2,500
-        if income <= BASELINE_THRESHOLD:
-            baseline_credit = 0
-        else:
-            baseline_credit = min(
-                (income - BASELINE_THRESHOLD) * PHASE_IN_RATE, MAX_REFUNDABLE
-            )
-
-        # Reform: phases in from $0
-        reform_credit = min(income * PHASE_IN_RATE, MAX_REFUNDABLE)
-
-        baseline_credits.append(baseline_credit)
-        reform_credits.append(reform_credit)
+    # Baseline: phases in from $2,500
+    baseline_credits = np.where(
+        income <= BASELINE_THRESHOLD,
+        0.0,
+        np.minimum((income - BASELINE_THRESHOLD) * PHASE_IN_RATE, MAX_REFUNDABLE),
+    )
+
+    # Reform: phases in from $0
+    reform_credits = np.minimum(income * PHASE_IN_RATE, MAX_REFUNDABLE)
+
+    # Round to cents; float noise like 365.0000000000001 only bloats chart JSON
+    baseline_credits = np.round(baseline_credits, 2)
+    reform_credits = np.round(reform_credits, 2)
+    # Results are cached and shared, so callers must not modify them
+    baseline_credits.flags.writeable = False
+    reform_credits.flags.writeable = False
 
     return employment_income_values, baseline_credits, reform_credits
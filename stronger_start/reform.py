@@ -3,7 +3,8 @@
 from policyengine_core.reforms import Reform
 
 # Define the reform: eliminate the $2,500 earnings threshold for refundable CTC
-stronger_start_reform = Reform.from_dict(
-    {"gov.irs.credits.ctc.refundable.phase_in.threshold": {"2026-01-01.2100-12-31": 0}},
-    country_id="us",
-)
+REFORM_PARAMETERS = {
+    "gov.irs.credits.ctc.refundable.phase_in.threshold": {"2026-01-01.2100-12-31": 0}
+}
+
+stronger_start_reform = Reform.from_dict(REFORM_PARAMETERS, country_id="us")
@@ -3,9 +3,11 @@
 Uses enhanced_cps dataset (the default) for estimates.
 """
 
-from policyengine_us import Microsimulation
-
-from .reform import stronger_start_reform
+from ._simulations import (
+    baseline_values,
+    get_baseline_simulation,
+    get_reform_simulation,
+)
 
 
 def calculate_budget_impact(year: int = 2026) -> dict:
@@ -19,20 +21,17 @@ def calculate_budget_impact(year: int = 2026) -> dict:
         Dictionary with budget impact metrics
     """
     print(f"Running baseline simulation for {year}...")
-    baseline = Microsimulation()
+    baseline = get_baseline_simulation()
     dataset_name = baseline.dataset.name
 
     print(f"Using dataset: {dataset_name}")
     print(f"Running reform simulation for {year}...")
-    reform = Microsimulation(reform=stronger_start_reform)
+    reform = get_reform_simulation()
 
     # Calculate federal income tax revenue at tax_unit level
     baseline_revenue = baseline.calculate("income_tax", period=year)
     reform_revenue = reform.calculate("income_tax", period=year)
 
-    # Get tax unit weights
-    baseline_weights = baseline.calculate("tax_unit_weight", period=year)
-
     # MicroSeries.sum() gives weighted sum, .values.sum() gives unweighted
     # Use weighted sum for totals
     baseline_total = baseline_revenue.sum()  # Weighted sum
@@ -45,10 +44,11 @@ def calculate_budget_impact(year: int = 2026) -> dict:
     baseline_ctc = baseline.calculate("refundable_ctc", period=year)
     reform_ctc = reform.calculate("refundable_ctc", period=year)
 
-    benefit_amount = reform_ctc.values - baseline_ctc.values
-    # Count beneficiaries using weights
-    beneficiaries = (baseline_weights.values[benefit_amount > 0]).sum()
-    total_tax_units = baseline_weights.values.sum()
+    benefit_amount = reform_ctc - baseline_ctc
+    # Count beneficiaries using weights: the weighted sum of a boolean
+    # MicroSeries is the total weight where it is True
+    beneficiaries = (benefit_amount > 0).sum()
+    total_tax_units = baseline_values("tax_unit_weight", year).sum()
     pct_benefiting = (beneficiaries / total_tax_units) * 100
 
     return {
@@ -3,18 +3,62 @@
 This module estimates the federal revenue impact from 2026 to 2035.
 """
 
+from collections.abc import Iterator
 from dataclasses import dataclass
+from functools import lru_cache
 
+import numpy as np
 
-@dataclass
+# Header rows of the markdown table built by format_impact_table
+IMPACT_TABLE_HEADER = (
+    "| Year | Annual Cost ($ millions) | Cumulative Cost ($ millions) |\n"
+    "|------|--------------------------|------------------------------|"
+)
+
+
+@dataclass(slots=True, frozen=True)
 class YearlyImpact:
-    """Impact data for a single year."""
+    """Impact data for a single year (immutable, so cached rows can be shared)."""
 
     year: int
     cost_millions: float
     cumulative_cost_millions: float
 
 
+@lru_cache(maxsize=32)
+def _project_costs(
+    base_year_cost_millions: float,
+    start_year: int,
+    end_year: int,
+    annual_growth_rate: float,
+) -> tuple[tuple[YearlyImpact, ...], float]:
+    """Project the yearly impacts and the rounded total, cached per argument set."""
+    # Apply growth rate for years after the base year, all years at once
+    years_since_base = np.arange(end_year - start_year + 1)
+    year_costs = base_year_cost_millions * np.power(
+        1 + annual_growth_rate, years_since_base
+    )
+    cumulative_costs = np.cumsum(year_costs).tolist()
+
+    # Round with Python's round(), which is correctly rounded; np.round scales
+    # by 10 first and can land on the wrong side of a .x5 boundary
+    yearly_impacts = tuple(
+        YearlyImpact(
+            year=year,
+            cost_millions=round(year_cost, 1),
+            cumulative_cost_millions=round(cumulative_cost, 1),
+        )
+        for year, year_cost, cumulative_cost in zip(
+            range(start_year, end_year + 1),
+            year_costs.tolist(),
+            cumulative_costs,
+        )
+    )
+    # An empty budget window (start_year > end_year) costs nothing
+    total_cost = cumulative_costs[-1] if cumulative_costs else 0
+    return yearly_impacts, round(total_cost, 1)
+
+
 def calculate_ten_year_impact(
     base_year_cost_millions: float = 1593,
     start_year: int = 2026,
@@ -39,38 +83,22 @@ def calculate_ten_year_impact(
     Returns:
         Tuple of (list of YearlyImpact objects, total 10-year cost in millions)
     """
-    yearly_impacts = []
-    cumulative_cost = 0
-
-    for i, year in enumerate(range(start_year, end_year + 1)):
-        # Apply growth rate for years after the base year
-        year_cost = base_year_cost_millions * ((1 + annual_growth_rate) ** i)
-        cumulative_cost += year_cost
-
-        yearly_impacts.append(
-            YearlyImpact(
-                year=year,
-                cost_millions=round(year_cost, 1),
-                cumulative_cost_millions=round(cumulative_cost, 1),
-            )
-        )
+    yearly_impacts, total_cost = _project_costs(
+        base_year_cost_millions, start_year, end_year, annual_growth_rate
+    )
+    return list(yearly_impacts), total_cost
 
-    return yearly_impacts, round(cumulative_cost, 1)
+
+def iter_impact_rows(yearly_impacts: list[YearlyImpact]) -> Iterator[str]:
+    """Yield the markdown impact table: the header, then one row per year."""
+    yield IMPACT_TABLE_HEADER
+    for impact in yearly_impacts:
+        yield f"| {impact.year} | {impact.cost_millions:,.1f} | {impact.cumulative_cost_millions:,.1f} |"
 
 
 def format_impact_table(yearly_impacts: list[YearlyImpact]) -> str:
     """Format yearly impacts as a markdown table."""
-    lines = [
-        "| Year | Annual Cost ($ millions) | Cumulative Cost ($ millions) |",
-        "|------|--------------------------|------------------------------|",
-    ]
-
-    for impact in yearly_impacts:
-        lines.append(
-            f"| {impact.year} | {impact.cost_millions:,.1f} | {impact.cumulative_cost_millions:,.1f} |"
-        )
-
-    return "\n".join(lines)
+    return "\n".join(iter_impact_rows(yearly_impacts))
 
 
 def main():
@@ -83,7 +111,7 @@ def main():
 
     yearly_impacts, total_cost = calculate_ten_year_impact()
 
-    print(format_impact_table(yearly_impacts))
+    print(*iter_impact_rows(yearly_impacts), sep="\n")
     print()
     print(f"Total 10-Year Cost: ${total_cost / 1000:.2f} billion")
     print()
@@ -1,25 +1,53 @@
 """Calculate 10-year budget impact by running simulation for each year."""
 
-from policyengine_us import Microsimulation
-
-from .reform import stronger_start_reform
-
-
-def calculate_yearly_cost(year: int) -> float:
-    """Calculate the cost for a specific year using microsimulation."""
-    print(f"  Simulating {year}...", end=" ", flush=True)
-
-    baseline = Microsimulation()
-    reform = Microsimulation(reform=stronger_start_reform)
+import json
+from concurrent.futures import ProcessPoolExecutor
+from functools import partial
+from pathlib import Path
+
+from ._simulations import (
+    get_baseline_simulation,
+    get_reform_simulation,
+    results_cache_key,
+)
+
+# Yearly costs are cached here between runs (shared with the dynamic charts)
+CACHE_DIR = Path("output") / ".cache"
+
+# Worker processes for main(). Each worker holds its own baseline and reform
+# enhanced_cps simulations (several GB together), so keep this small; with
+# fewer workers than years, each worker reuses its simulations across years.
+MAX_WORKERS = 2
+
+
+def calculate_yearly_cost(year: int, cache_dir: Path | None = None) -> float:
+    """Calculate the cost for a specific year using microsimulation.
+
+    If cache_dir is given, the cost is stored there keyed on the reform
+    parameters, year and policyengine-us version, and reused on later runs
+    instead of re-running the microsimulation.
+    """
+    if cache_dir is not None:
+        cache_path = cache_dir / f"yearly_cost_{results_cache_key(year)}.json"
+        if cache_path.exists():
+            return json.loads(cache_path.read_text())
+
+    # Simulations are shared across years; only the period changes
+    baseline = get_baseline_simulation()
+    reform = get_reform_simulation()
 
     baseline_revenue = baseline.calculate("income_tax", period=year)
     reform_revenue = reform.calculate("income_tax", period=year)
 
-    baseline_total = baseline_revenue.sum()
-    reform_total = reform_revenue.sum()
+    # One weighted sum of the per-tax-unit change, rather than differencing
+    # two trillion-dollar totals
+    revenue_change = (reform_revenue - baseline_revenue).sum()
+
+    cost_millions = float(-revenue_change / 1e6)
 
-    cost_millions = -(reform_total - baseline_total) / 1e6
-    print(f"${cost_millions:,.0f}M")
+    if cache_dir is not None:
+        cache_dir.mkdir(parents=True, exist_ok=True)
+        cache_path.write_text(json.dumps(cost_millions))
 
     return cost_millions
 
@@ -36,10 +64,14 @@ def main():
     years = list(range(2026, 2036))
     yearly_costs = []
 
+    # Years are independent, so simulate them in a few separate processes;
+    # map yields results in year order.
     print("Calculating costs by year:")
-    for year in years:
-        cost = calculate_yearly_cost(year)
-        yearly_costs.append(cost)
+    yearly_cost = partial(calculate_yearly_cost, cache_dir=CACHE_DIR)
+    with ProcessPoolExecutor(max_workers=MAX_WORKERS) as executor:
+        for year, cost in zip(years, executor.map(yearly_cost, years)):
+            print(f"  {year}: ${cost:,.0f}M")
+            yearly_costs.append(cost)
 
     print()
     print("-" * 60)
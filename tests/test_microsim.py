@@ -0,0 +1,62 @@
+"""Outcome bucketing in the decile microsimulation."""
+
+import numpy as np
+
+from stronger_start.dynamic_charts.microsim import (
+    _UNCATEGORIZED,
+    OUTCOME_KEYS,
+    _outcome_codes,
+    _percent_change,
+)
+
+
+def mask_outcome_codes(pct_change, income_change):
+    """Outcome codes from the explicit comparisons the bucketing replaced."""
+    masks = [
+        pct_change > 5,
+        (pct_change > 0) & (pct_change <= 5),
+        income_change == 0,
+        (pct_change < 0) & (pct_change >= -5),
+        pct_change < -5,
+    ]
+    assert len(masks) == len(OUTCOME_KEYS)
+
+    codes = np.full(len(pct_change), _UNCATEGORIZED, dtype=np.uint8)
+    for code, mask in enumerate(masks):
+        # The categories never overlap
+        assert not (mask & (codes != _UNCATEGORIZED)).any()
+        codes[mask] = code
+    return codes
+
+
+def test_outcome_codes_at_bucket_boundaries():
+    above_0 = np.nextafter(0.0, 1.0)
+    above_5 = np.nextafter(5.0, np.inf)
+    pct_change = np.array(
+        [0.0, 0.0, 5.0, -5.0, above_0, -above_0, above_5, -above_5, 100.0, -100.0]
+    )
+    # Nonzero change with a 0% change: baseline was non-positive
+    income_change = np.array([0.0, 10.0, 1, 1, 1, 1, 1, 1, 1, 1])
+
+    np.testing.assert_array_equal(
+        _outcome_codes(pct_change, income_change),
+        mask_outcome_codes(pct_change, income_change),
+    )
+
+
+def test_outcome_codes_for_non_positive_baselines():
+    baseline_income = np.array([-1000.0, -1000.0, 0.0, 0.0, 0.0, 1000.0, 1000.0])
+    income_change = np.array([500.0, 0.0, 500.0, -500.0, 0.0, 50.0, -50.0])
+
+    pct_change = _percent_change(income_change, baseline_income)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        expected = np.where(
+            baseline_income > 0, (income_change / baseline_income) * 100, 0
+        )
+    np.testing.assert_array_equal(pct_change, expected)
+
+    codes = _outcome_codes(pct_change, income_change)
+    np.testing.assert_array_equal(codes, mask_outcome_codes(pct_change, income_change))
+    np.testing.assert_array_equal(
+        codes, [_UNCATEGORIZED, 2, _UNCATEGORIZED, _UNCATEGORIZED, 2, 1, 3]
+    )